@@ -1,8 +1,8 @@
-from django.http import JsonResponse
 from django.conf import settings
 from typing import Callable
 
 from .exceptions import APIException
+from .responses import OrjsonResponse
 
 
 class ExceptionHandlingMiddleware:
@@ -28,24 +28,21 @@ class ExceptionHandlingMiddleware:
     def process_exception(self, request, exception):
         """
         Transforma exceções conforme os mapeamentos registrados,
-        e retorna JSONResponse apropriado.
+        e retorna a resposta JSON apropriada.
         """
         for exc_type, transformer in self.exception_mappings.items():
             if isinstance(exception, exc_type):
                 transformed = transformer(exception)
 
                 if isinstance(transformed, APIException):
-                    return JsonResponse(
-                        transformed.to_dict(),
-                        status=transformed.status_code,
-                    )
+                    return OrjsonResponse.from_exception(transformed)
 
                 return transformed
 
         if isinstance(exception, APIException):
-            return JsonResponse(exception.to_dict(), status=exception.status_code)
+            return OrjsonResponse.from_exception(exception)
 
-        return JsonResponse(
+        return OrjsonResponse(
             {
                 "message": "An unexpected error occurred.",
                 "errors": {"message": str(exception)} if bool(settings.DEBUG) else {},
@@ -1,8 +1,21 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from uuid import UUID
-from typing import Dict, Any, Optional, ClassVar
-
-from django.http import HttpRequest, JsonResponse
-from django.db.models import QuerySet, Model
+from typing import (
+    Dict,
+    Any,
+    List,
+    Optional,
+    ClassVar,
+    Tuple,
+    Type,
+    Iterable,
+    Iterator,
+)
+
+from django.http import HttpRequest, StreamingHttpResponse
+from django.db import connections, transaction, OperationalError
+from django.core.exceptions import ValidationError
+from django.db.models import QuerySet, Model, Prefetch, prefetch_related_objects
 
 from django_filters import FilterSet
 
@@ -10,6 +23,9 @@ from math import ceil
 
 from . import settings
 from . import exceptions
+from .responses import JSON_CONTENT_TYPE, OrjsonResponse
+from .serializers import SerializerFactory
+from .utils import json
 
 
 class ServiceCreateMixin:
@@ -126,9 +142,15 @@ class ViewCreateModelMixin:
 
     Métodos:
         post: Processa requisições POST para criar uma nova instância.
+
+    Attributes:
+        allow_empty_body (bool): Se True, requisições sem corpo não passam pela
+            verificação de campos obrigatórios.
     """
 
-    def post(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+    allow_empty_body: ClassVar[bool] = False
+
+    def post(self, request: HttpRequest, *args, **kwargs) -> OrjsonResponse:
         """
         Processa requisições POST para criar uma nova instância.
 
@@ -136,20 +158,21 @@ class ViewCreateModelMixin:
             request (HttpRequest): Objeto da requisição HTTP.
 
         Returns:
-            JsonResponse: Resposta JSON contendo os dados da nova instância criada ou erros de validação.
+            OrjsonResponse: Resposta JSON contendo os dados da nova instância criada ou erros de validação.
 
         Raises:
             exceptions.BadRequest: Se os dados enviados forem inválidos ou ausentes.
         """
         data = request.data
 
-        self.verify_fields(data, request)
+        if data or not self.allow_empty_body:
+            self.verify_fields(data, request)
 
         context = self.get_context(request)
         obj = self.service.perform_action("create", data=data, context=context)
         serialized_obj = self.serialize_object(obj)
 
-        return JsonResponse(serialized_obj, status=201)
+        return OrjsonResponse(serialized_obj, status=201)
 
 
 class ViewRetrieveModelMixin:
@@ -164,16 +187,38 @@ class ViewRetrieveModelMixin:
 
     paginate_by: ClassVar[int] = settings.DEFAULT_PAGINATED_BY
     filter_class: ClassVar[FilterSet] = None
+    count_timeout: ClassVar[Optional[int]] = None
+    select_related: ClassVar[Tuple[str, ...]] = ()
+    prefetch_related: ClassVar[Tuple[str | Prefetch, ...]] = ()
+    serializer_only_fields: ClassVar[Tuple[str, ...]] = ()
+    serializer_values_fields: ClassVar[Tuple[str, ...]] = ()
+    stream_list: ClassVar[bool] = False
+    pagination_mode: ClassVar[str] = "offset"
+    cursor_order_field: ClassVar[str] = "pk"
+    auto_related: ClassVar[bool] = False
+    list_serializer: ClassVar[Optional[Any]] = None
 
-    def get_filter_class(self) -> Optional[FilterSet]:
+    def __init_subclass__(cls, **kwargs) -> None:
         """
-        Retorna a classe de filtro caso esta esteja especificada.
+        Valida a classe de filtro uma única vez, na definição da view.
+
+        Raises:
+            TypeError: Se `filter_class` não for uma subclasse de `FilterSet`.
         """
-        if self.filter_class and not issubclass(self.filter_class, FilterSet):
+        super().__init_subclass__(**kwargs)
+
+        if cls.filter_class and not (
+            isinstance(cls.filter_class, type)
+            and issubclass(cls.filter_class, FilterSet)
+        ):
             raise TypeError(
                 "A classe de filtro deve ser uma subclasse de django_filters.FilterSet."
             )
 
+    def get_filter_class(self) -> Optional[FilterSet]:
+        """
+        Retorna a classe de filtro caso esta esteja especificada.
+        """
         return self.filter_class
 
     def get_queryset(self, filter_kwargs: Optional[Dict[str, Any]] = None):
@@ -194,10 +239,139 @@ class ViewRetrieveModelMixin:
             "list", filter_kwargs=filter_kwargs, context=context
         )
 
+    def get_related_lookups(self) -> Tuple[Tuple[str | Prefetch, ...], ...]:
+        """
+        Retorna os relacionamentos a serem carregados junto com os objetos.
+
+        Com `auto_related = True`, se `select_related` e `prefetch_related` não forem
+        definidos na view, os relacionamentos são deduzidos do transporte do
+        serializer (quando este os expõe via `related_lookups`). A dedução é ignorada
+        quando `serializer_only_fields`/`serializer_values_fields` estão definidos.
+
+        Returns:
+            Tuple[Tuple[str | Prefetch, ...], ...]: Caminhos para `select_related` e
+                para `prefetch_related`, respectivamente.
+        """
+        if (
+            self.select_related
+            or self.prefetch_related
+            or self.serializer_only_fields
+            or self.serializer_values_fields
+            or not self.auto_related
+        ):
+            return self.select_related, self.prefetch_related
+
+        return getattr(self.serializer, "related_lookups", ((), ()))
+
+    def optimize_queryset(self, queryset: QuerySet) -> QuerySet:
+        """
+        Aplica `select_related` e `prefetch_related` ao queryset (ver
+        `get_related_lookups`), evitando consultas N+1 durante a serialização dos
+        relacionamentos. Se `serializer_only_fields`
+        estiver definido, apenas essas colunas são carregadas (via `only`); campos
+        percorridos com `select_related` devem constar na lista (e.g., `author__name`).
+
+        `prefetch_related` aceita objetos `Prefetch`, permitindo restringir as colunas
+        dos objetos relacionados (e.g., `Prefetch("tags", queryset=Tag.objects.only("id",
+        "name"))`).
+
+        Se `serializer_values_fields` estiver definido, o queryset passa a retornar
+        dicionários com apenas esses campos (via `values`), dispensando a criação das
+        instâncias e o serializer na listagem.
+
+        Args:
+            queryset (QuerySet): Queryset a ser otimizado.
+
+        Returns:
+            QuerySet: Queryset com os relacionamentos configurados.
+        """
+        select_related, prefetch_related = self.get_related_lookups()
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+
+        if self.serializer_values_fields:
+            return queryset.prefetch_related(None).values(
+                *self.serializer_values_fields
+            )
+
+        if self.serializer_only_fields:
+            queryset = queryset.only(*self.serializer_only_fields)
+
+        return queryset
+
+    def get_list_serializer(self):
+        """
+        Retorna o serializador usado na listagem: `list_serializer`, se definido, ou o
+        serializador da view.
+        """
+        if self.list_serializer is None:
+            return self.get_serializer()
+
+        return SerializerFactory.get_serializer(self.list_serializer)
+
+    def serialize_queryset(
+        self, objects: Iterable[Model | Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Serializa os itens de uma página da listagem de uma só vez, obtendo o
+        serializador uma única vez (e.g., um schema marshmallow com `many=True`).
+        Linhas de `values` (ver `serializer_values_fields`) são retornadas sem
+        alterações. Se a view sobrescreve `serialize_object` e não define
+        `list_serializer`, cada item é serializado por `serialize_object`.
+
+        Args:
+            objects (Iterable[Model | Dict[str, Any]]): Itens da página.
+
+        Returns:
+            List[Dict[str, Any]]: Dados serializados dos itens.
+        """
+        if self.serializer_values_fields:
+            return list(objects)
+
+        if self.list_serializer is None and not getattr(
+            self, "_default_serialize_object", False
+        ):
+            serialize_object = self.serialize_object
+            return [serialize_object(obj) for obj in objects]
+
+        serializer = self.get_list_serializer()
+        serialize_many = getattr(serializer, "serialize_many", None)
+
+        if serialize_many is None:
+            return [serializer.serialize(obj) for obj in objects]
+
+        return serialize_many(objects)
+
+    def serialize_list_item(self, obj: Model | Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Serializa um item da listagem. Quando `serializer_values_fields` está definido,
+        o item já é um dicionário e é retornado sem alterações.
+
+        Args:
+            obj (Model | Dict[str, Any]): Instância do modelo ou linha de `values`.
+
+        Returns:
+            Dict[str, Any]: Dados serializados do item.
+        """
+        if self.serializer_values_fields:
+            return obj
+
+        if self.list_serializer is not None:
+            return self.get_list_serializer().serialize(obj)
+
+        return self.serialize_object(obj)
+
     def paginate_queryset(self, queryset, page_number):
         """
         Realiza a paginação básica do queryset com base no número da página.
 
+        Um item além do tamanho da página é incluído para que seja possível saber se
+        existe uma próxima página sem executar um `COUNT(*)`.
+
         Args:
             queryset (QuerySet): Queryset a ser paginado.
             page_number (int): Número da página desejada.
@@ -212,9 +386,145 @@ class ViewRetrieveModelMixin:
         start = (page_number - 1) * self.paginate_by
         end = start + self.paginate_by
 
-        return queryset[start:end]
+        return queryset[start : end + 1]
+
+    def paginate_queryset_by_cursor(
+        self, queryset: QuerySet, cursor: Optional[str]
+    ) -> QuerySet:
+        """
+        Realiza a paginação por cursor (keyset) do queryset, ordenado por
+        `cursor_order_field` (a chave primária por padrão). Ao contrário do `OFFSET`, o
+        custo da consulta não cresce com a profundidade da página.
+
+        O campo de ordenação deve ser único e, idealmente, indexado. O prefixo `-`
+        inverte a ordem (e.g., `"-id"`).
 
-    def retrieve(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        Um item além do tamanho da página é incluído para que seja possível saber se
+        existe uma próxima página.
+
+        Args:
+            queryset (QuerySet): Queryset a ser paginado.
+            cursor (Optional[str]): Cursor retornado pela página anterior, ou None
+                para a primeira página.
+
+        Returns:
+            QuerySet: Subconjunto do queryset correspondente à página solicitada.
+
+        Raises:
+            exceptions.BadRequest: Se o cursor for inválido.
+        """
+        order_field = self.cursor_order_field
+        field_name = order_field.lstrip("-")
+        lookup = "lt" if order_field.startswith("-") else "gt"
+
+        queryset = queryset.order_by(order_field)
+
+        if cursor:
+            queryset = queryset.filter(
+                **{f"{field_name}__{lookup}": self.decode_cursor(queryset, cursor)}
+            )
+
+        return queryset[: self.paginate_by + 1]
+
+    def encode_cursor(
+        self, obj: Model | Dict[str, Any], model: Optional[Type[Model]] = None
+    ) -> str:
+        """
+        Gera o cursor que aponta para os itens seguintes ao objeto informado.
+
+        Args:
+            obj (Model | Dict[str, Any]): Último item da página. Linhas de `values`
+                devem conter a chave de `cursor_order_field`; para `pk`, a coluna da
+                chave primária (e.g., `id`) também é aceita.
+            model (Optional[Type[Model]]): Modelo paginado, usado para localizar a
+                chave primária em linhas de `values`.
+
+        Returns:
+            str: Cursor opaco em base64.
+        """
+        field_name = self.cursor_order_field.lstrip("-")
+
+        if not isinstance(obj, dict):
+            value = getattr(obj, field_name)
+        elif field_name == "pk" and "pk" not in obj and model is not None:
+            value = obj[model._meta.pk.attname]
+        else:
+            value = obj[field_name]
+        return urlsafe_b64encode(json.dumps(value)).decode()
+
+    def decode_cursor(self, queryset: QuerySet, cursor: str) -> Any:
+        """
+        Decodifica um cursor gerado por `encode_cursor`.
+
+        Args:
+            queryset (QuerySet): Queryset paginado, usado para validar o valor.
+            cursor (str): Cursor recebido na query string.
+
+        Returns:
+            Any: Valor de `cursor_order_field` do último item da página anterior.
+
+        Raises:
+            exceptions.BadRequest: Se o cursor for inválido.
+        """
+        field_name = self.cursor_order_field.lstrip("-")
+        opts = queryset.model._meta
+        field = opts.pk if field_name == "pk" else opts.get_field(field_name)
+
+        try:
+            value = json.loads(urlsafe_b64decode(cursor.encode()))
+            return field.to_python(value)
+        except (ValueError, TypeError, ValidationError):
+            raise exceptions.BadRequest(
+                "Cursor inválido.", errors={"cursor": "Cursor malformado."}
+            )
+
+    def count_queryset(self, queryset) -> Optional[int]:
+        """
+        Conta o total de itens do queryset.
+
+        No PostgreSQL, se `count_timeout` (em milissegundos) estiver definido, a contagem
+        é limitada por um `statement_timeout` local e retorna None caso o tempo se esgote.
+        Dentro de uma transação externa (e.g., `ATOMIC_REQUESTS`), o valor anterior é
+        restaurado após a contagem, pois o `SET LOCAL` sobreviveria ao savepoint.
+
+        Args:
+            queryset (QuerySet): Queryset a ser contado.
+
+        Returns:
+            Optional[int]: Total de itens ou None se a contagem exceder o tempo limite.
+        """
+        connection = connections[queryset.db]
+
+        if self.count_timeout is None or connection.vendor != "postgresql":
+            return queryset.count()
+
+        in_outer_transaction = connection.in_atomic_block
+
+        try:
+            with transaction.atomic(using=queryset.db):
+                with connection.cursor() as cursor:
+                    if in_outer_transaction:
+                        cursor.execute("SHOW statement_timeout")
+                        (previous_timeout,) = cursor.fetchone()
+
+                    cursor.execute(
+                        f"SET LOCAL statement_timeout = {int(self.count_timeout)}"
+                    )
+
+                count = queryset.count()
+
+                if in_outer_transaction:
+                    with connection.cursor() as cursor:
+                        cursor.execute(
+                            "SELECT set_config('statement_timeout', %s, true)",
+                            [previous_timeout],
+                        )
+
+                return count
+        except OperationalError:
+            return None
+
+    def retrieve(self, request: HttpRequest, *args, **kwargs) -> OrjsonResponse:
         """
         Obtém os detalhes de uma única instância pelo ID.
 
@@ -224,30 +534,43 @@ class ViewRetrieveModelMixin:
             **kwargs: Argumentos nomeados adicionais.
 
         Returns:
-            JsonResponse: Resposta JSON contendo os dados da instância.
+            OrjsonResponse: Resposta JSON contendo os dados da instância.
 
         Raises:
             exceptions.BadRequest: Se nenhum identificador for especificado.
         """
         obj = self.get_object()
+        select_related, prefetch_related = self.get_related_lookups()
+
+        if select_related or prefetch_related:
+            prefetch_related_objects([obj], *select_related, *prefetch_related)
+
         serialized_obj = self.serialize_object(obj)
-        return JsonResponse(serialized_obj, status=200)
+        return OrjsonResponse(serialized_obj, status=200)
 
-    def list(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+    def list(self, request: HttpRequest, *args, **kwargs) -> OrjsonResponse:
         """
         Lista múltiplas instâncias do modelo com suporte a paginação e filtros.
 
+        O total de itens e de páginas só é calculado quando o parâmetro `count` é
+        enviado na query string (e.g., `?count=1`), evitando um `COUNT(*)` por requisição.
+
+        Com `pagination_mode = "cursor"`, a página é indicada pelo parâmetro `cursor`
+        (o `next_cursor` da resposta anterior) em vez de `page`.
+
         Args:
             request (HttpRequest): Objeto da requisição HTTP.
             *args: Argumentos adicionais.
             **kwargs: Argumentos nomeados adicionais.
 
         Returns:
-            JsonResponse: Resposta JSON contendo os resultados paginados e metadados de paginação.
+            OrjsonResponse: Resposta JSON contendo os resultados paginados e metadados de paginação.
         """
         filter_class = self.get_filter_class()
         query_dict = request.GET.copy()
         page = query_dict.pop("page", "1")[0]
+        cursor = query_dict.pop("cursor", [None])[0]
+        count = query_dict.pop("count", [""])[0]
 
         if filter_class is not None:
             queryset = self.get_queryset()
@@ -256,30 +579,110 @@ class ViewRetrieveModelMixin:
         else:
             queryset = self.get_queryset(filter_kwargs=query_dict.dict())
 
-        page_number = int(page)
+        queryset = self.optimize_queryset(queryset)
 
-        paginated_queryset = self.paginate_queryset(
-            queryset=queryset, page_number=page_number
-        )
+        if self.pagination_mode == "cursor":
+            paginated_queryset = self.paginate_queryset_by_cursor(queryset, cursor)
 
-        serialized_data = [self.serialize_object(obj) for obj in paginated_queryset]
+            pagination = {
+                "cursor": cursor,
+                "next_cursor": None,
+                "has_next": False,
+            }
+        else:
+            page_number = int(page)
 
-        total_items = queryset.count()
-        
-        response_data = {
-            "pagination": {
+            paginated_queryset = self.paginate_queryset(
+                queryset=queryset, page_number=page_number
+            )
+
+            pagination = {
                 "current_page": page_number,
-                "total_items": total_items,
-                "total_pages": ceil(total_items/self.paginate_by),
-                "has_next": len(paginated_queryset) == self.paginate_by,
+                "has_next": False,
                 "has_previous": page_number > 1,
-            },
+            }
+
+        if count.lower() in ("1", "true"):
+            total_items = self.count_queryset(queryset)
+            pagination["total_items"] = total_items
+            pagination["total_pages"] = (
+                ceil(total_items / self.paginate_by)
+                if total_items is not None
+                else None
+            )
+
+        if self.stream_list:
+            return StreamingHttpResponse(
+                self.stream_results(
+                    paginated_queryset.iterator(chunk_size=self.paginate_by + 1),
+                    pagination,
+                    model=queryset.model,
+                ),
+                content_type=JSON_CONTENT_TYPE,
+                status=200,
+            )
+
+        objects = list(paginated_queryset)
+        pagination["has_next"] = len(objects) > self.paginate_by
+
+        if pagination["has_next"] and "next_cursor" in pagination:
+            pagination["next_cursor"] = self.encode_cursor(
+                objects[self.paginate_by - 1], queryset.model
+            )
+
+        serialized_data = self.serialize_queryset(objects[: self.paginate_by])
+
+        response_data = {
+            "pagination": pagination,
             "results": serialized_data,
         }
 
-        return JsonResponse(response_data, status=200)
+        return OrjsonResponse(response_data, status=200)
 
-    def get(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+    def stream_results(
+        self,
+        objects: Iterable[Model],
+        pagination: Dict[str, Any],
+        model: Optional[Type[Model]] = None,
+    ) -> Iterator[bytes]:
+        """
+        Gera o corpo JSON da listagem em partes, serializando um objeto por vez.
+
+        Utilizado quando `stream_list` é True. Os metadados de paginação são enviados
+        após os resultados, pois `has_next` só é conhecido ao final da iteração. Erros
+        durante a serialização interrompem a resposta já iniciada.
+
+        Args:
+            objects (Iterable[Model]): Objetos da página (com um item excedente).
+            pagination (Dict[str, Any]): Metadados de paginação.
+            model (Optional[Type[Model]]): Modelo paginado, repassado a `encode_cursor`.
+
+        Yields:
+            bytes: Partes do corpo da resposta.
+        """
+        yield b'{"results":['
+
+        paginate_by = self.paginate_by
+        serialize = self.serialize_list_item
+        dumps = json.dumps
+        previous = None
+
+        for index, obj in enumerate(objects):
+            if index == paginate_by:
+                pagination["has_next"] = True
+
+                if "next_cursor" in pagination:
+                    pagination["next_cursor"] = self.encode_cursor(previous, model)
+
+                break
+
+            previous = obj
+
+            yield (b"," if index else b"") + dumps(serialize(obj))
+
+        yield b'],"pagination":' + json.dumps(pagination) + b"}"
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> OrjsonResponse:
         """
         Decide entre `retrieve` ou `list` com base na presença de um identificador.
 
@@ -289,9 +692,9 @@ class ViewRetrieveModelMixin:
             **kwargs: Argumentos nomeados adicionais.
 
         Returns:
-            JsonResponse: Resposta JSON contendo os dados da instância ou a lista de resultados.
+            OrjsonResponse: Resposta JSON contendo os dados da instância ou a lista de resultados.
         """
-        obj_id = kwargs.get(self.lookup_field)
+        obj_id = self.get_lookup_value()
 
         if obj_id is not None:
             return self.retrieve(request, *args, **kwargs)
@@ -309,35 +712,40 @@ class ViewUpdateModelMixin:
         put: Atualiza completamente uma instância (requisição PUT).
     """
 
-    def _update(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+    def _update(
+        self, request: HttpRequest, *args, data: Optional[Dict] = None, **kwargs
+    ) -> OrjsonResponse:
         """
         Realiza a lógica de atualização de uma instância.
 
         Args:
             request (HttpRequest): Objeto da requisição HTTP.
             *args: Argumentos adicionais.
+            data (Optional[Dict]): Dados já analisados e validados. Se não fornecidos,
+                são utilizados os dados da requisição.
             **kwargs: Argumentos nomeados adicionais.
 
         Returns:
-            JsonResponse: Resposta JSON contendo os dados da instância atualizada.
+            OrjsonResponse: Resposta JSON contendo os dados da instância atualizada.
 
         Raises:
             exceptions.BadRequest: Se nenhum identificador for especificado ou se os dados forem inválidos.
         """
-        obj_id = kwargs.get(self.lookup_field)
+        obj_id = self.get_lookup_value()
 
         if not obj_id:
             raise exceptions.BadRequest("Nenhum identificador especificado.")
 
-        data = request.data
+        if data is None:
+            data = request.data
 
         context = self.get_context(request)
         obj = self.service.perform_action("update", obj_id, data=data, context=context)
         serialized_obj = self.serialize_object(obj)
 
-        return JsonResponse(serialized_obj, status=200)
+        return OrjsonResponse(serialized_obj, status=200)
 
-    def patch(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+    def patch(self, request: HttpRequest, *args, **kwargs) -> OrjsonResponse:
         """
         Atualiza parcialmente uma instância do modelo (requisição PATCH).
 
@@ -347,13 +755,13 @@ class ViewUpdateModelMixin:
             **kwargs: Argumentos nomeados adicionais.
 
         Returns:
-            JsonResponse: Resposta JSON contendo os dados da instância atualizada.
+            OrjsonResponse: Resposta JSON contendo os dados da instância atualizada.
         """
         data = request.data
         self.verify_fields(data, request)
-        return self._update(request, *args, **kwargs)
+        return self._update(request, *args, data=data, **kwargs)
 
-    def put(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+    def put(self, request: HttpRequest, *args, **kwargs) -> OrjsonResponse:
         """
         Atualiza completamente uma instância do modelo (requisição PUT).
 
@@ -363,14 +771,14 @@ class ViewUpdateModelMixin:
             **kwargs: Argumentos nomeados adicionais.
 
         Returns:
-            JsonResponse: Resposta JSON contendo os dados da instância atualizada.
+            OrjsonResponse: Resposta JSON contendo os dados da instância atualizada.
 
         Raises:
             exceptions.BadRequest: Se os campos obrigatórios não forem fornecidos ou forem inválidos.
         """
         data = request.data
         self.verify_fields(data, request)
-        return self._update(request, *args, **kwargs)
+        return self._update(request, *args, data=data, **kwargs)
 
 
 class ViewDeleteModelMixin:
@@ -381,7 +789,7 @@ class ViewDeleteModelMixin:
        delete: Exclui uma instância do modelo pelo ID.
     """
 
-    def delete(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+    def delete(self, request: HttpRequest, *args, **kwargs) -> OrjsonResponse:
         """
         Exclui uma instância do modelo pelo ID.
 
@@ -391,12 +799,12 @@ class ViewDeleteModelMixin:
             **kwargs: Argumentos nomeados adicionais.
 
         Returns:
-            JsonResponse: Resposta JSON vazia com código HTTP 204 (No Content).
+            OrjsonResponse: Resposta JSON vazia com código HTTP 204 (No Content).
 
         Raises:
             exceptions.BadRequest: Se nenhum identificador for especificado.
         """
-        obj_id = kwargs.get(self.lookup_field)
+        obj_id = self.get_lookup_value()
 
         if not obj_id:
             raise exceptions.BadRequest("Nenhum identificador especificado.")
@@ -404,7 +812,7 @@ class ViewDeleteModelMixin:
         context = self.get_context(request)
         self.service.perform_action("delete", obj_id, context=context)
 
-        return JsonResponse({}, status=204)
+        return OrjsonResponse({}, status=204)
 
 
 __all__ = [
@@ -416,5 +824,4 @@ __all__ = [
     "ViewRetrieveModelMixin",
     "ViewUpdateModelMixin",
     "ViewDeleteModelMixin",
-    "ContentTypeHandlerMixin",
 ]
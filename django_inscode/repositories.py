@@ -1,25 +1,176 @@
 from abc import ABC, abstractmethod
-from django.db import transaction
-from django.db.models import Model, QuerySet, Manager, Q
+from django.db import connections, router, transaction, DatabaseError, IntegrityError
+from django.db.models import Model, QuerySet, Manager, Prefetch, Q
+from django.db.models.signals import pre_save
 from django.utils.translation import gettext as _
 from django.core.exceptions import (
     ValidationError,
-    ObjectDoesNotExist,
-    FieldDoesNotExist,
 )
 from django.db.models.fields.related import ManyToManyRel, ManyToManyField
 from django.apps import apps
 
 from django_softdelete.models import SoftDeleteModel
 
+from functools import lru_cache
 from uuid import UUID
-from typing import TypeVar, List, Dict, Any, Generic
+from typing import (
+    TypeVar,
+    List,
+    Dict,
+    Any,
+    Generic,
+    Optional,
+    Set,
+    Iterator,
+    ClassVar,
+    Tuple,
+    Type,
+)
 
 from .exceptions import BadRequest, InternalServerError, NotFound
 
 T = TypeVar("T", bound=Model)
 
 
+@lru_cache(maxsize=None)
+def _fields_by_name(model: Type[Model]) -> Dict[str, Any]:
+    """
+    Mapeia o nome e o `attname` (e.g., `author_id`) de cada campo do modelo para o
+    respectivo campo, incluindo relacionamentos inversos.
+
+    Args:
+        model (Type[Model]): Classe do modelo.
+
+    Returns:
+        Dict[str, Any]: Campos do modelo indexados por nome.
+    """
+    fields_by_name = {}
+
+    for field in sorted(
+        model._meta.get_fields(include_hidden=True),
+        key=lambda field: not field.auto_created,
+    ):
+        fields_by_name[field.name] = field
+        if getattr(field, "attname", None):
+            fields_by_name[field.attname] = field
+
+    return fields_by_name
+
+
+@lru_cache(maxsize=None)
+def _field_info(model: Type[Model], name: str) -> Optional[Tuple[Any, bool, bool]]:
+    """
+    Retorna um campo do modelo e a sua classificação.
+
+    Args:
+        model (Type[Model]): Classe do modelo.
+        name (str): Nome ou `attname` do campo.
+
+    Returns:
+        Optional[Tuple[Any, bool, bool]]: O campo, se é ManyToMany e se é uma chave
+            estrangeira (ou OneToOne); None se o campo não existir.
+    """
+    field = _fields_by_name(model).get(name)
+
+    if field is None:
+        return None
+
+    return (
+        field,
+        isinstance(field, (ManyToManyField, ManyToManyRel)),
+        field.is_relation and bool(field.many_to_one or field.one_to_one),
+    )
+
+
+@lru_cache(maxsize=None)
+def _editable_fields(model: Type[Model]) -> frozenset:
+    """
+    Retorna os nomes dos campos editáveis do modelo.
+
+    Args:
+        model (Type[Model]): Classe do modelo.
+
+    Returns:
+        frozenset: Nomes dos campos editáveis.
+    """
+    return frozenset(
+        field.name
+        for field in model._meta.get_fields(include_hidden=True)
+        if getattr(field, "editable", True)
+    )
+
+
+@lru_cache(maxsize=None)
+def _concrete_fields(model: Type[Model]) -> frozenset:
+    """
+    Retorna os nomes dos campos concretos (com coluna) do modelo.
+
+    Args:
+        model (Type[Model]): Classe do modelo.
+
+    Returns:
+        frozenset: Nomes dos campos concretos.
+    """
+    return frozenset(field.name for field in model._meta.concrete_fields)
+
+
+@lru_cache(maxsize=None)
+def _auto_now_fields(model: Type[Model]) -> frozenset:
+    """
+    Retorna os nomes dos campos com `auto_now`, que devem ser gravados em toda
+    atualização.
+
+    Args:
+        model (Type[Model]): Classe do modelo.
+
+    Returns:
+        frozenset: Nomes dos campos com `auto_now`.
+    """
+    return frozenset(
+        field.name
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False)
+    )
+
+
+@lru_cache(maxsize=None)
+def _constrained_fields(model: Type[Model]) -> frozenset:
+    """
+    Retorna os campos envolvidos em `unique_together` e `Meta.constraints`.
+
+    Estes campos nunca são excluídos da validação em atualizações parciais, pois
+    restrições de múltiplos campos precisam ser revalidadas quando qualquer um
+    deles muda. Se alguma restrição usar expressões, todos os campos são retornados.
+
+    Args:
+        model (Type[Model]): Classe do modelo.
+
+    Returns:
+        frozenset: Nomes dos campos envolvidos em restrições.
+    """
+    meta = model._meta
+    names = set()
+
+    for model_meta in [meta, *(parent._meta for parent in meta.get_parent_list())]:
+        for fields in model_meta.unique_together:
+            names.update(fields)
+
+        for constraint in model_meta.constraints:
+            condition = getattr(constraint, "condition", None)
+
+            if getattr(constraint, "expressions", ()) or not (
+                getattr(constraint, "fields", ()) or isinstance(condition, Q)
+            ):
+                return _concrete_fields(model)
+
+            names.update(getattr(constraint, "fields", ()))
+
+            if isinstance(condition, Q):
+                names.update(condition.referenced_base_fields)
+
+    return frozenset(names)
+
+
 class IRepository(ABC, Generic[T]):
     """
     Interface abstrata que define o contrato para repositórios.
@@ -31,6 +182,8 @@ class IRepository(ABC, Generic[T]):
         model (Model): O modelo Django associado ao repositório.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, model: T) -> None:
         """
@@ -151,16 +304,32 @@ class Repository(IRepository):
 
     Attributes:
         model (Model): O modelo Django associado ao repositório.
+        read_database (Optional[str]): Alias do banco usado nas leituras (`read`,
+            `list_all`, `filter`). Se None, o roteamento padrão do Django é utilizado.
+        select_related_fields (Tuple[str, ...]): Relacionamentos carregados via
+            `select_related` nas leituras.
+        prefetch_related_fields (Tuple[str | Prefetch, ...]): Relacionamentos carregados
+            via `prefetch_related` nas leituras. Aceita objetos `Prefetch` para limitar
+            as colunas ou filtrar os objetos relacionados, e.g.
+            `Prefetch("tags", queryset=Tag.objects.only("id", "name"))`.
     """
 
-    def __init__(self, model: T):
+    __slots__ = ("model", "read_database")
+
+    select_related_fields: ClassVar[Tuple[str, ...]] = ()
+    prefetch_related_fields: ClassVar[Tuple[str | Prefetch, ...]] = ()
+
+    def __init__(self, model: T, read_database: Optional[str] = None):
         """
         Inicializa o repositório com o modelo Django associado.
 
         Args:
             model (Model): O modelo Django que será manipulado pelo repositório.
+            read_database (Optional[str]): Alias do banco (e.g., uma réplica) usado
+                nas operações de leitura.
         """
         self.model = model
+        self.read_database = read_database
 
     def _format_validation_errors(self, error: ValidationError) -> List[Dict[str, Any]]:
         """
@@ -172,108 +341,184 @@ class Repository(IRepository):
         Returns:
             List[Dict[str, Any]]: Lista de dicionários contendo os campos e mensagens de erro.
         """
-        errors = []
-        if hasattr(error, "error_dict"):
-            for field, field_errors in error.error_dict.items():
-                for field_error in field_errors:
-                    message = (
+        error_dict = getattr(error, "error_dict", None)
+
+        if error_dict is not None:
+            return [
+                {
+                    "field": field,
+                    "message": (
                         field_error.message % field_error.params
                         if field_error.params
                         else field_error.message
-                    )
-                    errors.append({"field": field, "message": message})
-        elif hasattr(error, "error_list"):
-            for field_error in error.error_list:
-                message = (
+                    ),
+                }
+                for field, field_errors in error_dict.items()
+                for field_error in field_errors
+            ]
+
+        return [
+            {
+                "field": None,
+                "message": (
                     field_error.message % field_error.params
                     if field_error.params
                     else field_error.message
+                ),
+            }
+            for field_error in getattr(error, "error_list", ())
+        ]
+
+    def _get_many_to_many_objects(
+        self, many_to_many_data: Dict[str, List[Any]]
+    ) -> Dict[str, List[Any]]:
+        """
+        Valida os dados dos campos ManyToMany e retorna os valores a serem atribuídos.
+
+        IDs são verificados com uma única consulta por campo; instâncias e querysets
+        são repassados sem alterações.
+
+        Args:
+            many_to_many_data (Dict[str, List[Any]]): Dados para campos ManyToMany.
+
+        Returns:
+            Dict[str, List[Any]]: Valores prontos para `set()`, indexados pelo campo.
+
+        Raises:
+            BadRequest: Se houver campos inexistentes ou IDs inválidos.
+        """
+        related_objects_by_field = {}
+
+        for field_name, value in many_to_many_data.items():
+            field_info = _field_info(self.model, field_name)
+
+            if field_info is None:
+                raise BadRequest(
+                    message=f"Campo inexistente.",
+                    errors={f"{field_name}": "Este campo não existe no modelo."},
                 )
-                errors.append({"field": None, "message": message})
-        return errors
+
+            field, is_many_to_many, _ = field_info
+
+            if is_many_to_many:
+                related_model = field.remote_field.model
+
+            if not isinstance(value, (list, QuerySet)):
+                raise BadRequest(
+                    message=f"Valor inválido para o campo ManyToMany.",
+                    errors={
+                        f"{field_name}": "Esperada uma lista de IDs ou instâncias."
+                    },
+                )
+
+            if (
+                isinstance(value, QuerySet)
+                or not value
+                or not isinstance(value[0], (int, UUID, str))
+            ):
+                related_objects = value
+            else:
+                pk_field = related_model._meta.pk
+                ids = set()
+                related_objects = []
+
+                try:
+                    for v in value:
+                        if isinstance(v, (int, UUID, str)):
+                            ids.add(pk_field.to_python(v))
+                        else:
+                            related_objects.append(v)
+
+                    related_pks = (
+                        related_model.objects.filter(pk__in=ids)
+                        .order_by()
+                        .values_list("pk", flat=True)
+                    )
+
+                    missing_ids = {str(pk) for pk in ids.difference(related_pks)}
+
+                    if missing_ids:
+                        raise BadRequest(
+                            message=f"Alguns objetos relacionados não foram encontrados.",
+                            errors={f"{field_name}": f"IDs inválidos: {missing_ids}."},
+                        )
+
+                    related_objects.extend(ids)
+
+                except (ValueError, AttributeError, ValidationError):
+                    raise BadRequest(
+                        message=f"IDs inválidos.",
+                        errors={
+                            f"{field_name}": "IDs malformados.",
+                        },
+                    )
+
+            related_objects_by_field[field_name] = related_objects
+
+        return related_objects_by_field
 
     def _save(
-        self, instance: T, many_to_many_data: Dict[str, List[Any]] = None
+        self,
+        instance: T,
+        many_to_many_data: Dict[str, List[Any]] = None,
+        update_fields: Optional[Set[str]] = None,
     ) -> None:
         """
         Salva a instância no banco de dados, incluindo campos ManyToMany.
 
+        Quando `update_fields` é informado, apenas esses campos são gravados e os demais
+        (exceto os envolvidos em restrições de múltiplos campos) não são revalidados.
+
+        A validação da instância e dos IDs ManyToMany ocorre antes da transação, que
+        envolve apenas as escritas. Dentro de uma transação já aberta (e.g., em
+        `update`) nenhum savepoint é criado: um erro durante o salvamento invalida a
+        transação externa inteira.
+
         Args:
             instance (Model): Instância do modelo a ser salva.
             many_to_many_data (Dict[str, List[Any]], optional): Dados para campos ManyToMany.
+            update_fields (Set[str], optional): Campos alterados que devem ser gravados.
 
         Raises:
             BadRequest: Se houver problemas nos dados fornecidos.
-            InternalServerError: Se ocorrer um erro inesperado durante o salvamento.
+            InternalServerError: Se ocorrer um erro de banco de dados durante o salvamento.
         """
-        with transaction.atomic():
-            try:
+        try:
+            if update_fields is None:
                 instance.full_clean()
-                instance.save()
-
-                if many_to_many_data:
-                    for field_name, value in many_to_many_data.items():
-                        try:
-                            field = instance._meta.get_field(field_name)
-
-                            if isinstance(field, (ManyToManyField, ManyToManyRel)):
-                                related_model = field.remote_field.model
-
-                        except FieldDoesNotExist:
-                            raise BadRequest(
-                                message=f"Campo inexistente.",
-                                errors={
-                                    f"{field_name}": "Este campo não existe no modelo."
-                                },
-                            )
+            else:
+                instance.full_clean(
+                    exclude=[
+                        name
+                        for name in _concrete_fields(self.model)
+                        if name not in update_fields
+                        and name not in _constrained_fields(self.model)
+                    ]
+                )
 
-                        if not isinstance(value, (list, QuerySet)):
-                            raise BadRequest(
-                                message=f"Valor inválido para o campo ManyToMany.",
-                                errors={
-                                    f"{field_name}": "Esperada uma lista de IDs ou instâncias."
-                                },
-                            )
+            related_objects_by_field = self._get_many_to_many_objects(
+                many_to_many_data or {}
+            )
+        except ValidationError as e:
+            raise BadRequest(errors=self._format_validation_errors(e))
+        except DatabaseError as e:
+            raise InternalServerError(errors={"internal_server_error": str(e)})
 
-                        if all(isinstance(v, (int, UUID, str)) for v in value):
-                            try:
-                                ids = [str(v) for v in value]
-
-                                related_objects = related_model.objects.filter(
-                                    pk__in=ids
-                                )
-
-                                if len(related_objects) != len(value):
-                                    ids_found = set(
-                                        related_objects.values_list("pk", flat=True)
-                                    )
-
-                                    missing_ids = set(ids) - ids_found
-
-                                    raise BadRequest(
-                                        message=f"Alguns objetos relacionados não foram encontrados.",
-                                        errors={
-                                            f"{field_name}": f"IDs inválidos: {missing_ids}."
-                                        },
-                                    )
-
-                            except (ValueError, AttributeError):
-                                raise BadRequest(
-                                    message=f"IDs inválidos.",
-                                    errors={
-                                        f"{field_name}": "IDs malformados.",
-                                    },
-                                )
-                        else:
-                            related_objects = value
+        with transaction.atomic(savepoint=False):
+            try:
+                if update_fields is None:
+                    instance.save()
+                else:
+                    instance.save(update_fields=update_fields)
 
-                        getattr(instance, field_name).set(related_objects)
+                for field_name, related_objects in related_objects_by_field.items():
+                    getattr(instance, field_name).set(related_objects)
 
             except ValidationError as e:
                 raise BadRequest(errors=self._format_validation_errors(e))
-            except BadRequest as e:
-                raise e
-            except Exception as e:
+            except IntegrityError as e:
+                raise BadRequest(errors={"integrity": str(e)})
+            except DatabaseError as e:
                 raise InternalServerError(errors={"internal_server_error": str(e)})
 
     def create(self, **data) -> T:
@@ -291,27 +536,152 @@ class Repository(IRepository):
             self._handle_softdelete_uniqueness(data)
 
         many_to_many_data = {}
+        field_data = {}
 
         for field_name, value in data.items():
-            try:
-                field = self.model._meta.get_field(field_name)
-                if isinstance(field, (ManyToManyRel, ManyToManyField)):
-                    many_to_many_data[field_name] = value
-            except FieldDoesNotExist:
+            field_info = _field_info(self.model, field_name)
+
+            if field_info is None:
                 raise BadRequest(
                     message=f"Campo inexistente.",
                     errors={f"{field_name}": "Este campo não existe no modelo."},
                 )
 
-        for key in many_to_many_data.keys():
-            del data[key]
+            if field_info[1]:
+                many_to_many_data[field_name] = value
+            else:
+                field_data[field_name] = value
 
-        instance = self.model(**data)
+        instance = self.model(**field_data)
 
         self._save(instance, many_to_many_data)
 
         return instance
 
+    def bulk_create(
+        self, payloads: List[Dict[str, Any]], batch_size: int = 500
+    ) -> List[T]:
+        """
+        Cria várias instâncias de uma vez, com um `INSERT` por lote em vez de um por
+        instância. Os relacionamentos ManyToMany são gravados diretamente na tabela
+        intermediária, também em lote.
+
+        Cada instância é validada com `full_clean` antes da gravação. Sinais de
+        `save` não são disparados, como em `QuerySet.bulk_create`. Em bancos que não
+        retornam as chaves geradas no `INSERT` em lote (e.g., MySQL com `AutoField`),
+        dados ManyToMany só são aceitos se as chaves primárias forem definidas antes
+        da gravação (e.g., UUID).
+
+        Args:
+            payloads (List[Dict[str, Any]]): Dados de cada instância a ser criada.
+            batch_size (int): Quantidade de instâncias inseridas por consulta.
+
+        Returns:
+            List[T]: Instâncias criadas, na mesma ordem dos dados fornecidos.
+
+        Raises:
+            BadRequest: Se houver problemas nos dados fornecidos.
+            InternalServerError: Se ocorrer um erro inesperado durante a criação.
+        """
+        instances = []
+        many_to_many_rows = []
+
+        for data in payloads:
+            if issubclass(self.model, SoftDeleteModel):
+                self._handle_softdelete_uniqueness(data)
+
+            many_to_many_data = {}
+            field_data = {}
+
+            for field_name, value in data.items():
+                field_info = _field_info(self.model, field_name)
+
+                if field_info is None:
+                    raise BadRequest(
+                        message=f"Campo inexistente.",
+                        errors={f"{field_name}": "Este campo não existe no modelo."},
+                    )
+
+                if field_info[1]:
+                    many_to_many_data[field_name] = value
+                else:
+                    field_data[field_name] = value
+
+            instance = self.model(**field_data)
+
+            try:
+                instance.full_clean()
+                related_objects_by_field = self._get_many_to_many_objects(
+                    many_to_many_data
+                )
+            except ValidationError as e:
+                raise BadRequest(errors=self._format_validation_errors(e))
+            except DatabaseError as e:
+                raise InternalServerError(errors=[{"field": None, "message": str(e)}])
+
+            instances.append(instance)
+            many_to_many_rows.append(related_objects_by_field)
+
+        features = connections[router.db_for_write(self.model)].features
+
+        if not features.can_return_rows_from_bulk_insert and any(
+            instance.pk is None and any(related_objects_by_field.values())
+            for instance, related_objects_by_field in zip(instances, many_to_many_rows)
+        ):
+            raise BadRequest(
+                message="Relacionamentos ManyToMany não são suportados na criação em lote.",
+                errors={
+                    "many_to_many": "O banco de dados não retorna as chaves primárias "
+                    "geradas em inserções em lote."
+                },
+            )
+
+        with transaction.atomic(savepoint=False):
+            try:
+                self.model.objects.bulk_create(instances, batch_size=batch_size)
+
+                through_rows: Dict[type[Model], List[Model]] = {}
+
+                for instance, related_objects_by_field in zip(
+                    instances, many_to_many_rows
+                ):
+                    for field_name, related_objects in related_objects_by_field.items():
+                        field = _field_info(self.model, field_name)[0]
+
+                        if isinstance(field, ManyToManyRel):
+                            through = field.through
+                            source_name = field.field.m2m_reverse_field_name()
+                            target_name = field.field.m2m_field_name()
+                        else:
+                            through = field.remote_field.through
+                            source_name = field.m2m_field_name()
+                            target_name = field.m2m_reverse_field_name()
+
+                        source_attname = through._meta.get_field(source_name).attname
+                        target_attname = through._meta.get_field(target_name).attname
+
+                        through_rows.setdefault(through, []).extend(
+                            through(
+                                **{
+                                    source_attname: instance.pk,
+                                    target_attname: getattr(related, "pk", related),
+                                }
+                            )
+                            for related in related_objects
+                        )
+
+                for through, rows in through_rows.items():
+                    through.objects.bulk_create(
+                        rows, batch_size=batch_size, ignore_conflicts=True
+                    )
+
+            except IntegrityError as e:
+                raise BadRequest(errors={"integrity": str(e)})
+            except DatabaseError as e:
+                raise InternalServerError(errors={"internal_server_error": str(e)})
+
+        return instances
+
     def _handle_softdelete_uniqueness(self, data: dict):
         """
         Remove hard (definitivamente) objetos soft deleted que conflitam com campos únicos.
@@ -340,6 +710,28 @@ class Repository(IRepository):
             for obj in deleted_qs:
                 obj.hard_delete()
 
+    def _base_queryset(self) -> QuerySet[T]:
+        """
+        Retorna o queryset base das operações de leitura, direcionado para
+        `read_database` quando definido e com os relacionamentos configurados em
+        `select_related_fields` e `prefetch_related_fields`.
+
+        Returns:
+            QuerySet[T]: Queryset com todas as instâncias do modelo.
+        """
+        queryset = self.model.objects.all()
+
+        if self.read_database is not None:
+            queryset = queryset.using(self.read_database)
+
+        if self.select_related_fields:
+            queryset = queryset.select_related(*self.select_related_fields)
+
+        if self.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*self.prefetch_related_fields)
+
+        return queryset
+
     def read(self, id: UUID | int) -> T:
         """
         Busca uma instância existente no banco de dados via ID.
@@ -354,11 +746,31 @@ class Repository(IRepository):
             NotFound: Se a instância não for encontrada.
         """
         try:
-            instance = self.model.objects.get(id=id)
+            instance = self._base_queryset().get(id=id)
             return instance
         except self.model.DoesNotExist:
             raise NotFound(message=f"{self.model._meta.object_name} não encontrado")
 
+    def _read_for_update(self, id: UUID | int) -> T:
+        """
+        Busca uma instância via ID bloqueando a linha (`SELECT ... FOR UPDATE`) até o
+        fim da transação corrente.
+
+        Args:
+            id (UUID | int): Identificador da instância.
+
+        Returns:
+            Model: Instância encontrada do modelo.
+
+        Raises:
+            NotFound: Se a instância não for encontrada.
+        """
+        try:
+            return self.model.objects.select_for_update().get(id=id)
+        except self.model.DoesNotExist:
+            raise NotFound(message=f"{self.model._meta.object_name} não encontrado")
+
+    @transaction.atomic(savepoint=False)
     def update(self, id: UUID | int, **data) -> T:
         """
         Atualiza uma instância existente e seus relacionamentos many-to-many (diretos e inversos).
@@ -375,60 +787,98 @@ class Repository(IRepository):
             NotFound: Se o objeto não existir
             InternalServerError: Para erros inesperados
         """
-        instance = self.read(id)
-        meta = instance._meta
+        instance = self._read_for_update(id)
 
-        editable_fields = {
-            field.name
-            for field in meta.get_fields()
-            if getattr(field, "editable", True)
-        }
         many_to_many_data = {}
+        related_data: Dict[type[Model], Dict[str, Any]] = {}
+        changed_fields = set()
 
-        for key, value in data.items():
-            original_field_name = key
+        unknown_fields = sorted(
+            key for key in data if _field_info(self.model, key) is None
+        )
 
-            try:
-                field = meta.get_field(original_field_name)
-                field_name = field.name
-            except FieldDoesNotExist:
-                raise BadRequest(
-                    message=f"Campo '{original_field_name}' não existe no modelo.",
-                    errors={original_field_name: "Este campo não existe no modelo."},
-                )
+        if unknown_fields:
+            raise BadRequest(
+                message=f"Campo '{', '.join(unknown_fields)}' não existe no modelo.",
+                errors={
+                    field_name: "Este campo não existe no modelo."
+                    for field_name in unknown_fields
+                },
+            )
+
+        editable_fields = _editable_fields(self.model)
 
-            if isinstance(field, (ManyToManyField, ManyToManyRel)):
+        for key, value in data.items():
+            field, is_many_to_many, is_foreign_key = _field_info(self.model, key)
+            field_name = field.name
+
+            if is_many_to_many:
                 many_to_many_data[field_name] = value
                 continue
 
             if field_name not in editable_fields:
                 continue
 
-            try:
-                if field.is_relation and (field.many_to_one or field.one_to_one):
-                    if value is None:
-                        setattr(instance, field_name, None)
-                    else:
-                        related_model = field.related_model
-                        related_instance = (
-                            value
-                            if isinstance(value, related_model)
-                            else related_model.objects.get(pk=value)
-                        )
-                        setattr(instance, field_name, related_instance)
-                else:
-                    setattr(instance, field_name, value)
+            changed_fields.add(field_name)
+
+            if is_foreign_key:
+                related_model = field.related_model
 
-            except ObjectDoesNotExist:
+                if value is None or isinstance(value, related_model):
+                    setattr(instance, field_name, value)
+                else:
+                    related_data.setdefault(related_model, {})[field_name] = value
+            else:
+                setattr(instance, field_name, value)
+
+        for related_model, related_fields in related_data.items():
+            pk_field = related_model._meta.pk
+            related_pks = {}
+            missing_fields = []
+
+            for field_name, value in related_fields.items():
+                try:
+                    related_pks[field_name] = pk_field.to_python(value)
+                except ValidationError:
+                    missing_fields.append(field_name)
+
+            related_instances = related_model.objects.in_bulk(related_pks.values())
+
+            missing_fields += [
+                field_name
+                for field_name, pk in related_pks.items()
+                if pk not in related_instances
+            ]
+
+            if missing_fields:
                 raise BadRequest(
-                    message=f"Objeto relacionado não encontrado para o campo '{field_name}'.",
-                    errors={field_name: "Referência inválida"},
+                    message=f"Objeto relacionado não encontrado para o campo '{', '.join(missing_fields)}'.",
+                    errors={
+                        field_name: "Referência inválida"
+                        for field_name in missing_fields
+                    },
                 )
 
-        self._save(instance, many_to_many_data)
+            for field_name, pk in related_pks.items():
+                setattr(instance, field_name, related_instances[pk])
+
+        update_fields = None
+
+        # Só grava as colunas alteradas quando nenhum `save`, `clean` ou receptor de
+        # `pre_save` pode alterar outros campos da instância.
+        if (
+            changed_fields
+            and self.model.save is Model.save
+            and self.model.clean is Model.clean
+            and not pre_save.has_listeners(self.model)
+        ):
+            update_fields = changed_fields | _auto_now_fields(self.model)
+
+        self._save(instance, many_to_many_data, update_fields)
 
         return instance
 
+    @transaction.atomic(savepoint=False)
     def delete(self, id: UUID | int) -> None:
         """
         Exclui uma instância existente no banco de dados via ID.
@@ -438,15 +888,17 @@ class Repository(IRepository):
 
         Raises:
             NotFound: Se a instância não for encontrada.
-            InternalServerError: Se ocorrer um erro inesperado durante a exclusão.
+            BadRequest: Se a exclusão violar uma restrição (e.g., `on_delete=PROTECT`).
+            InternalServerError: Se ocorrer um erro de banco de dados durante a exclusão.
         """
-        instance = self.read(id)
+        instance = self._read_for_update(id)
 
-        with transaction.atomic():
-            try:
-                instance.delete()
-            except Exception as e:
-                raise InternalServerError(errors=[{"field": None, "message": str(e)}])
+        try:
+            instance.delete()
+        except IntegrityError as e:
+            raise BadRequest(errors=[{"field": None, "message": str(e)}])
+        except DatabaseError as e:
+            raise InternalServerError(errors=[{"field": None, "message": str(e)}])
 
     def list_all(self) -> QuerySet[T]:
         """
@@ -455,7 +907,7 @@ class Repository(IRepository):
         Returns:
             QuerySet[T]: Conjunto de resultados contendo todas as instâncias do modelo.
         """
-        return self.model.objects.all()
+        return self._base_queryset()
 
     def filter(self, **kwargs) -> QuerySet[T]:
         """
@@ -467,7 +919,59 @@ class Repository(IRepository):
         Returns:
             QuerySet[T]: Conjunto de resultados contendo as instâncias que atendem aos filtros.
         """
-        return self.model.objects.filter(**kwargs)
+        return self._base_queryset().filter(**kwargs)
+
+    def iterate(self, chunk_size: int = 2000, **kwargs) -> Iterator[T]:
+        """
+        Percorre as instâncias que atendem aos filtros em blocos, sem manter todo o
+        conjunto de resultados em memória. Sem filtros, percorre todas as instâncias.
+
+        O iterador retornado só pode ser consumido uma vez.
+
+        Args:
+            chunk_size (int): Quantidade de registros buscados por vez.
+            **kwargs: Argumentos de filtro para a consulta.
+
+        Returns:
+            Iterator[T]: Iterador sobre as instâncias encontradas.
+        """
+        return self.filter(**kwargs).iterator(chunk_size=chunk_size)
+
+    def iterate_values(
+        self, *fields: str, chunk_size: int = 2000, **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre, em blocos, apenas os campos informados das instâncias que atendem
+        aos filtros, sem instanciar os modelos.
+
+        O iterador retornado só pode ser consumido uma vez.
+
+        Args:
+            *fields (str): Campos a serem retornados em cada dicionário.
+            chunk_size (int): Quantidade de registros buscados por vez.
+            **kwargs: Argumentos de filtro para a consulta.
+
+        Returns:
+            Iterator[Dict[str, Any]]: Iterador sobre os dicionários encontrados.
+        """
+        return (
+            self.filter(**kwargs)
+            .prefetch_related(None)
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
+    def exists(self, **kwargs) -> bool:
+        """
+        Verifica se existe alguma instância que atenda aos filtros fornecidos.
+
+        Args:
+            **kwargs: Argumentos de filtro para a consulta.
+
+        Returns:
+            bool: True se ao menos uma instância for encontrada.
+        """
+        return self.filter(**kwargs).exists()
 
     @property
     def manager(self) -> Manager[Model]:
@@ -0,0 +1,44 @@
+from django.http import HttpResponse
+
+from typing import Any
+
+from .exceptions import APIException
+from .utils.json import dumps
+
+JSON_CONTENT_TYPE = "application/json"
+
+
+class OrjsonResponse(HttpResponse):
+    """
+    Resposta HTTP que serializa os dados em JSON utilizando o orjson.
+
+    Substitui o `JsonResponse` do Django, cujo encoder baseado na biblioteca `json`
+    padrão é consideravelmente mais lento para corpos grandes.
+    """
+
+    def __init__(self, data: Any, **kwargs) -> None:
+        """
+        Inicializa a resposta serializando os dados fornecidos.
+
+        Args:
+            data (Any): Dados a serem serializados.
+            **kwargs: Argumentos adicionais repassados ao `HttpResponse` (e.g., `status`).
+        """
+        kwargs.setdefault("content_type", JSON_CONTENT_TYPE)
+        super().__init__(content=dumps(data), **kwargs)
+
+    @classmethod
+    def from_exception(cls, exception: APIException) -> "OrjsonResponse":
+        """
+        Cria a resposta de erro correspondente a uma `APIException`.
+
+        Args:
+            exception (APIException): Exceção a ser convertida.
+
+        Returns:
+            OrjsonResponse: Resposta com o corpo e o status da exceção.
+        """
+        return cls(exception.to_dict(), status=exception.status_code)
+
+
+__all__ = ["JSON_CONTENT_TYPE", "OrjsonResponse"]
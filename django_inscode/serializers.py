@@ -1,9 +1,12 @@
 from dataclasses import fields, is_dataclass
+from functools import cached_property
 from typing import (
     Any,
     Dict,
+    Iterable,
     List,
     Optional,
+    Tuple,
     Union,
     get_args,
     get_origin,
@@ -14,6 +17,7 @@ from decimal import Decimal
 from uuid import UUID
 
 from django.db import models
+from django.core.exceptions import FieldDoesNotExist
 from django.core.files.base import File
 
 from marshmallow import Schema
@@ -25,6 +29,24 @@ import datetime
 SerializedData = Dict[str, Any]
 
 
+def _nested_transport(field_type: Any) -> Optional[Type]:
+    """
+    Retorna o transporte aninhado em um tipo (e.g., `T`, `Optional[T]` ou `List[T]`).
+
+    :param field_type: O tipo declarado no campo do transporte.
+    :return: A classe de transporte encontrada, ou None.
+    """
+    if is_dataclass(field_type):
+        return field_type
+
+    for arg in get_args(field_type):
+        nested = _nested_transport(arg)
+        if nested is not None:
+            return nested
+
+    return None
+
+
 class SerializerInterface(Protocol):
     def serialize(self, obj: Any) -> SerializedData: ...
 
@@ -32,13 +54,27 @@ class SerializerInterface(Protocol):
 class MarshmallowSerializerAdapter(SerializerInterface):
     """
     Adaptador do serializador do marshmallow para a interface de SerializerInterface.
+
+    As instâncias do schema são criadas na primeira serialização e reutilizadas nas
+    seguintes.
     """
 
     def __init__(self, schema_class: Type[Schema]):
         self.schema_class = schema_class
 
+    @cached_property
+    def schema(self) -> Schema:
+        return self.schema_class()
+
+    @cached_property
+    def many_schema(self) -> Schema:
+        return self.schema_class(many=True)
+
     def serialize(self, obj: Schema):
-        return self.schema_class().dump(obj)
+        return self.schema.dump(obj)
+
+    def serialize_many(self, objs: Iterable[Any]) -> List[SerializedData]:
+        return self.many_schema.dump(objs)
 
 
 class Serializer(SerializerInterface):
@@ -70,6 +106,67 @@ class Serializer(SerializerInterface):
         self.model = model
         self.transport = transport
 
+    @cached_property
+    def related_lookups(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Relacionamentos percorridos pelo transporte (inclusive os aninhados), no
+        formato aceito por `select_related` e `prefetch_related`.
+
+        Calculado uma única vez por serializador.
+
+        Returns:
+            Tuple[Tuple[str, ...], Tuple[str, ...]]: Caminhos para `select_related` e
+                para `prefetch_related`, respectivamente.
+        """
+        select_related = []
+        prefetch_related = []
+        self._collect_related_lookups(
+            self.model, self.transport, "", False, select_related, prefetch_related
+        )
+        return tuple(select_related), tuple(prefetch_related)
+
+    def _collect_related_lookups(
+        self,
+        model: Type[models.Model],
+        transport: Type[Transport],
+        prefix: str,
+        prefetching: bool,
+        select_related: List[str],
+        prefetch_related: List[str],
+    ) -> None:
+        """Percorre os campos do transporte acumulando os relacionamentos."""
+        for field in fields(transport):
+            try:
+                model_field = model._meta.get_field(field.name)
+            except FieldDoesNotExist:
+                continue
+
+            # `get_field` também resolve attnames (e.g., `author_id`), que não são
+            # caminhos válidos para `select_related`/`prefetch_related`.
+            if not model_field.is_relation or model_field.name != field.name:
+                continue
+
+            path = f"{prefix}{field.name}"
+            related_model = model_field.related_model
+            many = model_field.many_to_many or model_field.one_to_many
+
+            if prefetching or many or related_model is None:
+                prefetch_related.append(path)
+            else:
+                select_related.append(path)
+
+            nested = _nested_transport(field.type)
+
+            if nested is not None and related_model is not None:
+                self._collect_related_lookups(
+                    related_model,
+                    nested,
+                    f"{path}__",
+                    prefetching or many,
+                    select_related,
+                    prefetch_related,
+                )
+
     def serialize(self, instance) -> Dict[str, Any]:
         """
         Serializa uma instância do modelo em um dicionário com base no transporte.
@@ -100,6 +197,19 @@ class Serializer(SerializerInterface):
 
         return serialized_data
 
+    def serialize_many(self, instances: Iterable[models.Model]) -> List[Dict[str, Any]]:
+        """
+        Serializa uma sequência de instâncias do modelo.
+
+        Args:
+            instances (Iterable[Model]): Instâncias a serem serializadas.
+
+        Returns:
+            List[Dict[str, Any]]: Lista com os dados serializados de cada instância.
+        """
+        serialize = self.serialize
+        return [serialize(instance) for instance in instances]
+
     def _get_field_value(self, instance: models.Model, field_name: str) -> Any:
         """Obtém o valor de um campo."""
         field = instance._meta.get_field(field_name)
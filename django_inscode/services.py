@@ -126,7 +126,7 @@ class GenericModelService:
         elif action == "update" and isinstance(self, mixins.ServiceUpdateMixin):
             pk = args[0]
             instance = self.repository.read(pk)
-            validated_data: Optional[Data] = self.validate(data, instance=instance)
+            validated_data = self.validate(data, instance=instance)
             return self.update(
                 *args,
                 data=validated_data if validated_data is not None else data,
@@ -1,2 +1,3 @@
 DEFAULT_PAGINATED_BY = 30
 DEFAULT_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+DEFAULT_JSON_ORJSON_MIN_BYTES = 0
@@ -1,9 +1,25 @@
 from django.conf import settings as django_settings
 
 from datetime import datetime
+from functools import lru_cache
+import re
+from zoneinfo import ZoneInfo
 
 from django_inscode import settings
-import pytz
+
+_DATETIME_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}( \d{2}:\d{2}:\d{2})?", re.ASCII)
+
+
+@lru_cache(maxsize=1)
+def _get_timezone(time_zone: str) -> ZoneInfo:
+    """
+    Retorna o fusohorário correspondente ao nome informado, reutilizando o objeto
+    entre as chamadas.
+
+    :param time_zone: O nome do fusohorário (e.g., 'America/Sao_Paulo').
+    :return: Um objeto ZoneInfo.
+    """
+    return ZoneInfo(time_zone)
 
 
 def get_actual_datetime() -> datetime:
@@ -13,8 +29,7 @@ def get_actual_datetime() -> datetime:
 
     :return: Um objeto datetime.
     """
-    tz = pytz.timezone(django_settings.TIME_ZONE)
-    return datetime.now(tz=tz)
+    return datetime.now(tz=_get_timezone(django_settings.TIME_ZONE))
 
 
 def parse_str_to_datetime(datetime_str: str) -> datetime:
@@ -30,6 +45,13 @@ def parse_str_to_datetime(datetime_str: str) -> datetime:
             f"O argumento deve ser uma string, mas foi recebido: {type(datetime_str).__name__}"
         )
 
+    if _DATETIME_PATTERN.fullmatch(datetime_str):
+        # Formatos canônicos são convertidos pelo fromisoformat, bem mais rápido
+        try:
+            return datetime.fromisoformat(datetime_str)
+        except ValueError:
+            pass
+
     try:
         # Tenta analisar o formato com data e hora
         return datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,69 @@
+import json as stdlib_json
+
+from typing import Any
+
+from django.conf import settings as django_settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+import orjson
+
+from .. import settings
+
+DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+_django_encoder = DjangoJSONEncoder()
+
+
+def _default(value: Any) -> Any:
+    """
+    Converte os tipos que o orjson não serializa nativamente (ou que são repassados
+    via `OPT_PASSTHROUGH_DATETIME`) exatamente como o `DjangoJSONEncoder`, mantendo o
+    formato de datas e horas (milissegundos e sufixo `Z`).
+
+    :param value: O valor a ser convertido.
+    :return: Uma representação serializável do valor.
+    :raises TypeError: Se o tipo do valor não for suportado.
+    """
+    return _django_encoder.default(value)
+
+
+def loads(content: bytes | str) -> Any:
+    """
+    Converte um conteúdo JSON em objetos Python utilizando o orjson.
+
+    Conteúdos menores que `JSON_ORJSON_MIN_BYTES` (configuração do Django, padrão 0)
+    são convertidos com a biblioteca `json` padrão.
+
+    :param content: O conteúdo JSON em bytes ou string.
+    :return: O objeto Python correspondente.
+    :raises ValueError: Se o conteúdo não for um JSON válido.
+    """
+    min_bytes = getattr(
+        django_settings,
+        "JSON_ORJSON_MIN_BYTES",
+        settings.DEFAULT_JSON_ORJSON_MIN_BYTES,
+    )
+
+    try:
+        if len(content) < min_bytes:
+            return stdlib_json.loads(content)
+
+        return orjson.loads(content)
+    except ValueError:
+        raise ValueError("JSON inválido na requisição.")
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Serializa um objeto Python em JSON (bytes) utilizando o orjson.
+
+    Dados que o orjson não consegue serializar (e.g., inteiros maiores que 64 bits)
+    são serializados pela biblioteca `json` padrão com o `DjangoJSONEncoder`.
+
+    :param data: O objeto a ser serializado.
+    :return: O JSON serializado em bytes.
+    """
+    try:
+        return orjson.dumps(data, default=_default, option=DUMPS_OPTIONS)
+    except orjson.JSONEncodeError:
+        return stdlib_json.dumps(data, cls=DjangoJSONEncoder).encode()
@@ -1,19 +1,20 @@
+from __future__ import annotations
+
 from django.views import View
 from django.core.exceptions import ImproperlyConfigured
 from django.contrib.auth.models import AnonymousUser
-from django.http import HttpRequest, JsonResponse
 from django.utils.module_loading import import_string
 from django.conf import settings
 
-from typing import Set, Dict, Any, List, Union, ClassVar, Optional, Type
+from typing import TYPE_CHECKING
+from collections import ChainMap
 
 from . import mixins
 from . import exceptions
 
-from .permissions import BasePermission
-from .services import GenericModelService, OrchestratorService
-from .serializers import SerializerInterface, SerializerFactory
-from .authentication import BaseAuthentication
+from .serializers import SerializerFactory
+from .responses import OrjsonResponse
+from .utils import json
 
 try:
     from marshmallow import Schema, ValidationError
@@ -21,12 +22,59 @@ except ImportError:
     Schema = None
     ValidationError = None
 
-import json
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+    from typing import (
+        Any,
+        ClassVar,
+        Dict,
+        FrozenSet,
+        List,
+        Mapping,
+        MutableMapping,
+        Optional,
+        Sequence,
+        Tuple,
+        Type,
+        Union,
+    )
+
+    from .permissions import BasePermission
+    from .services import GenericModelService, OrchestratorService
+    from .serializers import SerializerInterface
+    from .authentication import BaseAuthentication
+
+    Serializer = Union[Schema, SerializerInterface]
+    Service = Union[GenericModelService, OrchestratorService]
+    Context = Dict[str, Any]
+    Data = MutableMapping[str, Any]
+
+
+class _MultipartData(ChainMap):
+    """
+    Visão dos dados de uma requisição multipart que não copia `request.POST` e
+    `request.FILES`.
+
+    Deve ser criada como `_MultipartData({}, request.FILES, request.POST)`. Arquivos têm
+    precedência sobre campos de mesmo nome e alterações são gravadas apenas no primeiro
+    dicionário. Remoções e `clear` descartam a visão sobre os dados originais.
+    """
+
+    def __delitem__(self, key):
+        self.maps = [dict(self)]
+        del self.maps[0][key]
 
-Serializer = Union[Schema, SerializerInterface]
-Service = Union[GenericModelService, OrchestratorService]
-Context = Dict[str, Any]
-Data = Dict[str, Any]
+    def pop(self, key, *args):
+        self.maps = [dict(self)]
+        return self.maps[0].pop(key, *args)
+
+    def popitem(self):
+        self.maps = [dict(self)]
+        return self.maps[0].popitem()
+
+    def clear(self):
+        self.maps = [{}]
 
 
 class GenericView(View):
@@ -42,23 +90,68 @@ class GenericView(View):
         fields (List[str]): Lista de campos permitidos na view (validação simples).
         input_schema (Optional[Type[Schema]]): Schema marshmallow para validação de entrada.
             Se definido, tem prioridade sobre o campo 'fields'.
+        lookup_field (Optional[str]): Argumento da URL que identifica o objeto da
+            requisição. Se definido, `get_object` só é chamado no `dispatch` quando o
+            valor retornado por `get_lookup_value` não é vazio.
+        stateful_permissions (bool): Se True, as permissões são instanciadas a cada
+            requisição. Por padrão, as instâncias são criadas na definição da view e
+            compartilhadas entre as requisições, portanto `has_permission` e
+            `has_object_permission` não devem alterar o estado da permissão.
     """
 
     service: ClassVar[Service] = None
     permissions_classes: ClassVar[List[BasePermission]] = None
+    stateful_permissions: ClassVar[bool] = False
     fields: ClassVar[List[str]] = []
     authentication_classes: ClassVar[List[BaseAuthentication]] = []
     input_schema: ClassVar[Optional[Type[Schema]]] = None
+    lookup_field: ClassVar[Optional[str]] = None
+
+    _required_attributes: ClassVar[Tuple[str, ...]] = ("service",)
+    _fields_set: ClassVar[frozenset] = frozenset()
+    _fields_source: ClassVar[Optional[List[str]]] = None
+    _missing_attributes: ClassVar[Tuple[str, ...]] = ("service",)
+    _has_get_object: ClassVar[bool] = False
+    _permission_instances: ClassVar[Tuple[BasePermission, ...]] = ()
+    _permissions_source: ClassVar[Optional[List[BasePermission]]] = None
+    _permissions: Optional[Sequence[BasePermission]] = None
+    _context: Optional[Context] = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Pré-calcula, na definição da view, o conjunto de campos obrigatórios, os
+        atributos obrigatórios ausentes, as instâncias das permissões e se a view
+        sobrescreve `get_object`.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._fields_set = frozenset(cls.fields or ())
+        cls._fields_source = cls.fields
+        cls._missing_attributes = tuple(
+            attr for attr in cls._required_attributes if not getattr(cls, attr, None)
+        )
+        cls._has_get_object = cls.get_object is not GenericView.get_object
+        cls._permissions_source = cls.permissions_classes
+
+        if not cls.stateful_permissions:
+            cls._permission_instances = tuple(
+                permission() for permission in cls.permissions_classes or ()
+            )
 
     def __init__(self, **kwargs) -> None:
         """
         Inicializa a view e valida os atributos obrigatórios.
 
+        A validação completa só é refeita quando atributos são passados via
+        `as_view(**kwargs)` ou quando algum atributo obrigatório estava ausente na
+        definição da classe.
+
         Args:
             **kwargs: Argumentos adicionais para inicialização.
         """
         super().__init__(**kwargs)
-        self._validate_required_attributes()
+
+        if kwargs or self._missing_attributes:
+            self._validate_required_attributes()
 
         if not self.authentication_classes:
             self.authentication_classes = self.get_default_authentication_classes()
@@ -89,7 +182,7 @@ class GenericView(View):
             except exceptions.Unauthorized as e:
                 raise exceptions.Unauthorized(str(e))
 
-    def _parse_request_data(self, request: HttpRequest) -> Dict[str, Any]:
+    def _parse_request_data(self, request: HttpRequest) -> Mapping[str, Any]:
         """
         Analisa os dados da requisição com base no tipo de conteúdo.
 
@@ -97,20 +190,15 @@ class GenericView(View):
             request (HttpRequest): Objeto da requisição HTTP.
 
         Returns:
-            Dict[str, Any]: Dados analisados da requisição.
+            Mapping[str, Any]: Dados analisados da requisição.
 
         Raises:
             ValueError: Se o formato do conteúdo não for suportado ou se o JSON for inválido.
         """
         if request.content_type == "application/json":
-            try:
-                return json.loads(request.body) if request.body else {}
-            except json.JSONDecodeError:
-                raise ValueError("JSON inválido na requisição.")
+            return json.loads(request.body) if request.body else {}
         elif request.content_type.startswith("multipart/form-data"):
-            data = request.POST.dict()
-            files = {key: request.FILES[key] for key in request.FILES}
-            return {**data, **files}
+            return _MultipartData({}, request.FILES, request.POST)
         else:
             return {}
 
@@ -121,9 +209,8 @@ class GenericView(View):
         Raises:
             ImproperlyConfigured: Se algum atributo obrigatório estiver ausente.
         """
-        required_attributes = {"service"}
         missing_attributes = [
-            attr for attr in required_attributes if not getattr(self, attr)
+            attr for attr in self._required_attributes if not getattr(self, attr)
         ]
 
         if missing_attributes:
@@ -145,30 +232,62 @@ class GenericView(View):
         """
         Retorna o contexto adicional para operações no serviço.
 
+        O contexto é construído uma única vez por view (uma instância por requisição)
+        e reutilizado nas chamadas seguintes (e.g., em `get_object` e na ação
+        executada).
+
         Args:
             request (HttpRequest): Objeto da requisição HTTP.
 
         Returns:
             Context: Contexto adicional com informações do usuário, sessão e view.
         """
-        return {
-            "user": request.user,
-            "session": request.session,
-            "url_params": self.kwargs,
-            "query_params": request.GET.dict(),
-        }
+        context = self._context
+
+        if context is None:
+            context = {
+                "user": request.user,
+                "session": request.session,
+                "url_params": self.kwargs,
+                "query_params": request.GET.dict(),
+            }
+            self._context = context
 
-    def get_permissions(self) -> List[BasePermission]:
+        return context
+
+    def get_permissions(self) -> Sequence[BasePermission]:
         """
-        Instancia e retorna as classes de permissão configuradas.
+        Retorna as instâncias das classes de permissão configuradas.
+
+        As instâncias criadas na definição da view são reutilizadas, exceto quando
+        `stateful_permissions` é True ou `permissions_classes` foi alterado na
+        instância (e.g., via `as_view`).
 
         Returns:
-            List[BasePermission]: Lista de instâncias das classes de permissão.
+            Sequence[BasePermission]: Sequência de instâncias das classes de permissão.
         """
+        if (
+            not self.stateful_permissions
+            and self.permissions_classes is self._permissions_source
+        ):
+            return self._permission_instances
+
         if not self.permissions_classes:
             return []
         return [permission() for permission in self.permissions_classes]
 
+    def get_lookup_value(self):
+        """
+        Retorna o valor do argumento da URL indicado por `lookup_field`.
+
+        Returns:
+            Any: Valor do argumento, ou None se ausente ou sem `lookup_field`.
+        """
+        if self.lookup_field is None:
+            return None
+
+        return self.kwargs.get(self.lookup_field)
+
     def get_object(self):
         """Método para retornar o objeto atrelado à View"""
         pass
@@ -177,6 +296,9 @@ class GenericView(View):
         """
         Verifica se todas as permissões são concedidas.
 
+        As permissões são instanciadas uma única vez por requisição e reutilizadas nas
+        verificações seguintes.
+
         Args:
             request (HttpRequest): Objeto da requisição HTTP.
             obj (Any, optional): Objeto específico para verificar permissões de objeto.
@@ -184,21 +306,67 @@ class GenericView(View):
         Raises:
             exceptions.Forbidden: Se alguma permissão for negada.
         """
-        for permission in self.get_permissions():
+        for permission in self._get_request_permissions(request):
             if not permission.has_permission(request, self):
                 raise exceptions.Forbidden(message=permission.message)
 
             if obj and not permission.has_object_permission(request, self, obj):
                 raise exceptions.Forbidden(message=permission.message)
 
-    def get_fields(self) -> Set[str]:
+    def check_object_permissions(self, request: HttpRequest, obj: Any) -> None:
+        """
+        Verifica apenas as permissões de objeto, para quando `has_permission` já foi
+        verificado na requisição.
+
+        Args:
+            request (HttpRequest): Objeto da requisição HTTP.
+            obj (Any): Objeto específico para verificar permissões de objeto.
+
+        Raises:
+            exceptions.Forbidden: Se alguma permissão for negada.
+        """
+        if not obj:
+            return
+
+        for permission in self._get_request_permissions(request):
+            if not permission.has_object_permission(request, self, obj):
+                raise exceptions.Forbidden(message=permission.message)
+
+    def _get_request_permissions(
+        self, request: HttpRequest
+    ) -> Sequence[BasePermission]:
+        """
+        Retorna as permissões da requisição, instanciando-as apenas na primeira chamada.
+
+        As instâncias ficam na própria view (uma por requisição), e não no `request`,
+        para que uma view chamada por outra com a mesma requisição use as suas
+        próprias permissões.
+
+        Args:
+            request (HttpRequest): Objeto da requisição HTTP.
+
+        Returns:
+            Sequence[BasePermission]: Sequência de instâncias das classes de permissão.
+        """
+        permissions = self._permissions
+
+        if permissions is None:
+            permissions = self.get_permissions()
+            self._permissions = permissions
+
+        return permissions
+
+    def get_fields(self) -> FrozenSet[str]:
         """
         Retorna os campos obrigatórios para requisições de criação.
 
         Returns:
-            Set[str]: Conjunto de nomes dos campos permitidos.
+            FrozenSet[str]: Conjunto de nomes dos campos permitidos.
         """
-        return self.fields or []
+        if self.fields is self._fields_source:
+            return self._fields_set
+
+        return frozenset(self.fields or ())
 
     def verify_fields(self, data: Data, request: HttpRequest = None) -> None:
         """
@@ -264,7 +432,7 @@ class GenericView(View):
         Raises:
             exceptions.BadRequest: Se campos obrigatórios estiverem faltando
         """
-        missing_fields = set(self.get_fields()) - set(data.keys())
+        missing_fields = frozenset(self.get_fields()).difference(data)
 
         if missing_fields:
             raise exceptions.BadRequest(
@@ -300,10 +468,11 @@ class GenericView(View):
 
         self.check_permissions(request)
 
-        if hasattr(self, "get_object") and callable(self.get_object):
+        if self._has_get_object:
             try:
-                obj = self.get_object()
-                self.check_permissions(request, obj)
+                if self.lookup_field is None or self.get_lookup_value():
+                    obj = self.get_object()
+                    self.check_object_permissions(request, obj)
             except exceptions.BadRequest:
                 pass
 
@@ -325,7 +494,7 @@ class GenericOrchestratorView(GenericView):
 
     service: ClassVar[OrchestratorService] = None
 
-    def execute(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+    def execute(self, request: HttpRequest, *args, **kwargs) -> OrjsonResponse:
         """
         Método principal para executar a lógica orquestrada delegada ao serviço orquestrador.
 
@@ -335,7 +504,7 @@ class GenericOrchestratorView(GenericView):
             **kwargs: Argumentos nomeados adicionais.
 
         Returns:
-            JsonResponse: Resposta JSON contendo o resultado da operação.
+            OrjsonResponse: Resposta JSON contendo o resultado da operação.
 
         Raises:
             exceptions.BadRequest: Se os dados enviados forem inválidos.
@@ -350,7 +519,7 @@ class GenericOrchestratorView(GenericView):
             *args, data=data, request=request, context=context, **kwargs
         )
 
-        return JsonResponse(result, status=200)
+        return OrjsonResponse(result, status=200)
 
 
 class GenericModelView(GenericView):
@@ -366,40 +535,72 @@ class GenericModelView(GenericView):
         service (GenericModelService): Serviço associado à view.
         permissions_classes (List[Type[BasePermission]]): Lista de classes de permissão.
         fields (List[str]): Lista de campos permitidos na view.
+        lookup_field_type (Optional[type]): Tipo usado para converter o valor de lookup
+            (e.g., `UUID` ou `int`). Se None, o valor é repassado sem conversão.
     """
 
     serializer: ClassVar[Serializer] = None
     service: ClassVar[GenericModelService] = None
     lookup_field: ClassVar[str] = "pk"
+    lookup_field_type: ClassVar[Optional[type]] = None
 
-    def _validate_required_attributes(self):
-        """
-        Valida se os atributos obrigatórios foram definidos.
+    _required_attributes: ClassVar[Tuple[str, ...]] = ("service", "serializer")
+    _serializer_instance: ClassVar[Optional[SerializerInterface]] = None
+    _serializer_source: ClassVar[Optional[Serializer]] = None
+    _default_serialize_object: ClassVar[bool] = True
 
-        Atributos obrigatórios incluem `service` e `serializer`.
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Obtém, na definição da view, o serializador usado em todas as requisições.
+        Serializadores não suportados continuam gerando erro apenas na requisição.
 
-        Raises:
-            ImproperlyConfigured: Se algum atributo obrigatório estiver ausente.
+        Também registra se a view sobrescreve `serialize_object`, caso em que a
+        listagem serializa item a item por esse método.
         """
-        required_attributes = {"service", "serializer"}
-        missing_attributes = [
-            attr for attr in required_attributes if not getattr(self, attr)
-        ]
+        super().__init_subclass__(**kwargs)
+        cls._default_serialize_object = (
+            cls.serialize_object is GenericModelView.serialize_object
+        )
+        cls._serializer_source = cls.serializer
+        cls._serializer_instance = None
 
-        if missing_attributes:
-            raise ImproperlyConfigured(
-                f"A classe {self.__class__.__name__} deve definir os atributos: "
-                f"{', '.join(missing_attributes)}"
-            )
+        if cls.serializer is not None:
+            try:
+                cls._serializer_instance = SerializerFactory.get_serializer(
+                    cls.serializer
+                )
+            except TypeError:
+                pass
 
     def get_lookup_value(self):
         """
         Retorna o valor do campo de lookup usado para identificar uma instância específica.
 
+        Se `lookup_field_type` estiver definido, o valor é convertido para esse tipo.
+
         Returns:
             Any: Valor do campo de lookup obtido dos argumentos da URL.
+
+        Raises:
+            exceptions.BadRequest: Se o valor não puder ser convertido.
         """
-        return self.kwargs.get(self.lookup_field)
+        lookup_value = self.kwargs.get(self.lookup_field)
+        lookup_field_type = self.lookup_field_type
+
+        if (
+            lookup_value is None
+            or lookup_field_type is None
+            or isinstance(lookup_value, lookup_field_type)
+        ):
+            return lookup_value
+
+        try:
+            return lookup_field_type(lookup_value)
+        except (TypeError, ValueError):
+            raise exceptions.BadRequest(
+                "Identificador inválido.",
+                errors={self.lookup_field: "Identificador malformado."},
+            )
 
     def get_object(self):
         """
@@ -423,14 +624,22 @@ class GenericModelView(GenericView):
 
     def get_serializer(self):
         """
-        Retorna a classe de serializador associada à view.
+        Retorna o serializador associado à view.
+
+        A instância obtida na definição da view é reutilizada, exceto quando
+        `serializer` foi alterado na instância (e.g., via `as_view`).
 
         Returns:
             Serializer: Instância da classe de serializador configurada.
 
         Raises:
-            ImproperlyConfigured: Se o atributo `serializer` não estiver definido.
+            TypeError: Se o tipo do serializador não for suportado.
         """
+        serializer = self._serializer_instance
+
+        if serializer is not None and self.serializer is self._serializer_source:
+            return serializer
+
         return SerializerFactory.get_serializer(self.serializer)
 
     def serialize_object(self, obj):
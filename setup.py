@@ -1,24 +1,35 @@
 from setuptools import setup, find_packages
-import sys
 
-CURRENT_PYTHON = sys.version_info[:2]
-REQUIRED_PYTHON = (3, 12)
 
-if CURRENT_PYTHON < REQUIRED_PYTHON:
-    sys.stderr.write(
-        """
-==============================
-Versão do Python não suportada
-==============================
+def get_ext_modules():
+    """
+    Compila os módulos do caminho crítico das requisições com o Cython, quando
+    disponível. Sem o Cython (ou sem um compilador C) o pacote é instalado em
+    Python puro, sem nenhuma alteração de comportamento.
+    """
+    try:
+        from Cython.Build import cythonize
+        from Cython.Compiler.Errors import CompileError
+    except ImportError:
+        return []
 
-Esta versão do Django Inscode requer o python Python {}.{}, mas você está tentando
-instalar na versão {}.{}.
-
-""".format(
-            *(REQUIRED_PYTHON + CURRENT_PYTHON)
+    try:
+        ext_modules = cythonize(
+            [
+                "django_inscode/views.py",
+                "django_inscode/serializers.py",
+                "django_inscode/services.py",
+            ],
+            # As anotações documentam tipos (e.g., `Mapping`), não os verificam.
+            compiler_directives={"language_level": 3, "annotation_typing": False},
         )
-    )
-    sys.exit(1)
+    except CompileError:
+        return []
+
+    for ext in ext_modules:
+        ext.optional = True
+
+    return ext_modules
 
 
 def read(f):
@@ -34,14 +45,18 @@ setup(
     long_description_content_type="text/markdown",
     packages=find_packages(),
     include_package_data=True,
+    ext_modules=get_ext_modules(),
     install_requires=[
         "Django>=5.1",
         "django-soft-delete>=1.0.16",
-        "pytz>=2024.2",
         "marshmallow>=3.26.0",
         "django-filter>=24.3",
         "mozilla-django-oidc>=4.0.1",
+        "orjson>=3.10",
     ],
+    extras_require={
+        "speedups": ["Cython>=3.0"],
+    },
     python_requires=">=3.12",
     classifiers=[
         "Framework :: Django",